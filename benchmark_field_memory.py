@@ -0,0 +1,95 @@
+#!/usr/bin/env python3
+"""
+Memory benchmark for generate_subforms field records.
+Runs ROW_COUNT synthetic checklist rows through the old per-field dict code
+and through field_from_row, then prints the per-row overhead of each.
+"""
+
+import gc
+import tracemalloc
+from collections import defaultdict
+
+from generate_subforms import field_from_row
+
+# Configuration
+ROW_COUNT = 1_000_000
+SUBFORM_COUNT = 1000
+FREQUENCIES = ['Annual', 'Quarterly', 'Monthly', 'Semi-Annual', 'Weekly', 'Quinquennial']
+ASSIGNMENTS = ['BORIS', 'MECH', 'ELEC', 'PLUMB']
+
+def make_row(i):
+    """Return synthetic CSV row i as csv.DictReader produces it (fresh strings on every row)"""
+    return {
+        'NAMING CONVENTION': f"2.4-DCVA-{i % SUBFORM_COUNT}",
+        'Inspection Task': f"2.4-A-DCVA-{i}",
+        'Frequency': ''.join(FREQUENCIES[i % len(FREQUENCIES)]),
+        'JB Task Assignment': ''.join(ASSIGNMENTS[i % len(ASSIGNMENTS)]),
+        'Description': f"Inspect device {i % 500} per NYC regulations.",
+        'Measurement Type': ''.join('YesNo'),
+        'Response Type': ''.join('Specific List'),
+    }
+
+def dict_from_row(row):
+    """Old representation: the per-field dict generate_subforms used to build"""
+    measurement_type = row.get('Measurement Type', '').strip()
+    response_type = row.get('Response Type', '').strip()
+    
+    description = row.get('Description', '').strip()
+    description = ' '.join(description.split())
+    
+    field = {
+        'inspection_task': row.get('Inspection Task', '').strip(),
+        'frequency': row.get('Frequency', '').strip(),
+        'jb_task_assignment': row.get('JB Task Assignment', '').strip(),
+        'description': description
+    }
+    
+    if measurement_type == 'YesNo':
+        field['type'] = 'Single Select'
+    
+    if response_type == 'Specific List' and measurement_type == 'YesNo':
+        field['options'] = ['Yes', 'No']
+    
+    return field
+
+def build(make_field):
+    """Group ROW_COUNT synthetic rows by naming convention, like generate_subforms.main"""
+    subforms = defaultdict(list)
+    for i in range(ROW_COUNT):
+        row = make_row(i)
+        subforms[row['NAMING CONVENTION'].strip()].append(make_field(row))
+    return subforms
+
+def build_dicts():
+    """Old path: one dict plus a fresh options list per row"""
+    return build(dict_from_row)
+
+def build_records():
+    """New path: slotted Field records from generate_subforms"""
+    return build(field_from_row)
+
+def measure(builder):
+    """Return bytes still allocated after builder() runs"""
+    gc.collect()
+    tracemalloc.start()
+    result = builder()
+    current, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    del result
+    gc.collect()
+    return current
+
+def main():
+    print(f"Building {ROW_COUNT:,} rows across {SUBFORM_COUNT} subforms...")
+
+    dict_bytes = measure(build_dicts)
+    record_bytes = measure(build_records)
+
+    print(f"\n{'Representation':<16}{'Total MB':>12}{'Bytes/row':>12}")
+    print(f"{'dict':<16}{dict_bytes / 1e6:>12.1f}{dict_bytes / ROW_COUNT:>12.1f}")
+    print(f"{'Field':<16}{record_bytes / 1e6:>12.1f}{record_bytes / ROW_COUNT:>12.1f}")
+    print(f"\nSaved {(dict_bytes - record_bytes) / ROW_COUNT:.1f} bytes/row "
+          f"({100 * (1 - record_bytes / dict_bytes):.0f}%)")
+
+if __name__ == '__main__':
+    main()
@@ -14,6 +14,9 @@ from reportlab.platypus.frames import Frame
 from reportlab.platypus.doctemplate import PageTemplate, BaseDocTemplate
 from reportlab.lib import colors
 from reportlab.lib.enums import TA_LEFT, TA_CENTER
+from layout_cache import CachedParagraph
+import layout_cache
+from upload_queue import build_entry, load_uploaded, write_upload_queue
 
 # Configuration
 SUBFORMS_DIR = 'subforms'
@@ -62,18 +65,29 @@ def main():
         folder_counts = {}
         count = 0
         
+        # Previously uploaded forms (and their content hashes) for change tracking
+        uploaded = load_uploaded()
+        queue_entries = []
+        
         for json_file in json_files:
             folder = get_folder_name(json_file)
-            process_subform(json_file, folder)
+            pdf_path, data = process_subform(json_file, folder)
+            queue_entries.append(build_entry(folder, pdf_path, data, uploaded))
             folder_counts[folder] = folder_counts.get(folder, 0) + 1
             count += 1
         
         print(f"\nCreated {count} PDFs organized into folders:")
         for folder in sorted(folder_counts.keys()):
             print(f"  Folder '{folder}': {folder_counts[folder]} PDFs")
+        
+        # Ordered work queue for the batch uploader
+        write_upload_queue(OUTPUT_DIR, queue_entries)
+    
+    # Paragraph layouts reused across subforms
+    layout_cache.report()
 
 def process_subform(json_filename, folder='1'):
-    """Process a single JSON subform and create a PDF"""
+    """Process a single JSON subform and create a PDF. Returns (pdf_path, data)"""
     json_path = os.path.join(SUBFORMS_DIR, json_filename)
     pdf_filename = json_filename.replace('.json', '.pdf')
     
@@ -163,7 +177,7 @@ def process_subform(json_filename, folder='1'):
     content_width = page_width - 0.3*inch
     
     # Add title box
-    title_data = [[Paragraph(f"<b>SUBFORM: {data['name']}</b>", title_style)]]
+    title_data = [[CachedParagraph(f"<b>SUBFORM: {data['name']}</b>", title_style)]]
     title_table = Table(title_data, colWidths=[content_width])
     title_table.setStyle(TableStyle([
         ('BACKGROUND', (0, 0), (-1, -1), colors.black),
@@ -207,12 +221,12 @@ def process_subform(json_filename, folder='1'):
             
             contractor_field_data = [
                 [
-                    Paragraph(f"<b>Contractor:</b>", body_style),
-                    Paragraph(contractor, body_style)
+                    CachedParagraph(f"<b>Contractor:</b>", body_style),
+                    CachedParagraph(contractor, body_style)
                 ],
                 [
-                    Paragraph(f"<b>Type:</b>", body_style),
-                    Paragraph("Info Text", body_style)
+                    CachedParagraph(f"<b>Type:</b>", body_style),
+                    CachedParagraph("Info Text", body_style)
                 ]
             ]
             
@@ -248,25 +262,25 @@ def process_subform(json_filename, folder='1'):
         # Field details - Label on left (30%), Value on right (70%)
         # Keep Contractor in the main field box
         field_data.append([
-            Paragraph(f"<b>Contractor:</b>", body_style),
-            Paragraph(contractor if contractor else '', body_style)
+            CachedParagraph(f"<b>Contractor:</b>", body_style),
+            CachedParagraph(contractor if contractor else '', body_style)
         ])
         field_data.append([
-            Paragraph(f"<b>Description:</b>", body_style),
-            Paragraph(field['description'], body_style)
+            CachedParagraph(f"<b>Description:</b>", body_style),
+            CachedParagraph(field['description'], body_style)
         ])
         
         if 'type' in field:
             field_data.append([
-                Paragraph(f"<b>Type:</b>", body_style),
-                Paragraph(field['type'], body_style)
+                CachedParagraph(f"<b>Type:</b>", body_style),
+                CachedParagraph(field['type'], body_style)
             ])
         
         if 'options' in field:
             options_str = ', '.join(field['options'])
             field_data.append([
-                Paragraph(f"<b>Options:</b>", body_style),
-                Paragraph(options_str, body_style)
+                CachedParagraph(f"<b>Options:</b>", body_style),
+                CachedParagraph(options_str, body_style)
             ])
         
         # Create table for this field with two columns (30% / 70% split)
@@ -298,6 +312,8 @@ def process_subform(json_filename, folder='1'):
     # Build PDF
     doc.build(story)
     print(f"Created: {pdf_path}")
+    
+    return pdf_path, data
 
 if __name__ == '__main__':
     main()
@@ -15,6 +15,9 @@ from reportlab.platypus.frames import Frame
 from reportlab.platypus.doctemplate import PageTemplate, BaseDocTemplate
 from reportlab.lib import colors
 from reportlab.lib.enums import TA_LEFT, TA_CENTER
+from layout_cache import CachedParagraph
+import layout_cache
+from upload_queue import build_entry, load_uploaded, write_upload_queue
 
 # Configuration
 SUBFORMS_DIR = 'subforms'
@@ -63,18 +66,29 @@ def main():
         folder_counts = {}
         count = 0
         
+        # Previously uploaded forms (and their content hashes) for change tracking
+        uploaded = load_uploaded()
+        queue_entries = []
+        
         for json_file in json_files:
             folder = get_folder_name(json_file)
-            process_subform(json_file, folder)
+            pdf_path, data = process_subform(json_file, folder)
+            queue_entries.append(build_entry(folder, pdf_path, data, uploaded))
             folder_counts[folder] = folder_counts.get(folder, 0) + 1
             count += 1
         
         print(f"\nCreated {count} PDFs organized into folders:")
         for folder in sorted(folder_counts.keys()):
             print(f"  Folder '{folder}': {folder_counts[folder]} PDFs")
+        
+        # Ordered work queue for the batch uploader
+        write_upload_queue(OUTPUT_DIR, queue_entries)
+    
+    # Paragraph layouts reused across subforms
+    layout_cache.report()
 
 def process_subform(json_filename, folder='1'):
-    """Process a single JSON subform and create a PDF"""
+    """Process a single JSON subform and create a PDF. Returns (pdf_path, data)"""
     json_path = os.path.join(SUBFORMS_DIR, json_filename)
     pdf_filename = json_filename.replace('.json', '.pdf')
     
@@ -163,7 +177,7 @@ def process_subform(json_filename, folder='1'):
     content_width = page_width - 0.3*inch
     
     # Add title box
-    title_data = [[Paragraph(f"<b>INSTRUCTIONS FOR CREATING SUBFORM: {data['name']}</b>", title_style)]]
+    title_data = [[CachedParagraph(f"<b>INSTRUCTIONS FOR CREATING SUBFORM: {data['name']}</b>", title_style)]]
     title_table = Table(title_data, colWidths=[content_width])
     title_table.setStyle(TableStyle([
         ('BACKGROUND', (0, 0), (-1, -1), colors.black),
@@ -178,7 +192,7 @@ def process_subform(json_filename, folder='1'):
     story.append(Spacer(1, 0.12*inch))
     
     # Add instructions header
-    story.append(Paragraph("Follow these steps to create the form fields:", instruction_style))
+    story.append(CachedParagraph("Follow these steps to create the form fields:", instruction_style))
     story.append(Spacer(1, 0.08*inch))
     
     # Track step number
@@ -195,10 +209,10 @@ def process_subform(json_filename, folder='1'):
         single_task_assignment = list(task_assignments_set)[0]
         step_number += 1
         instruction_text = f"<b>STEP {step_number}: Create an Info Text field</b>"
-        story.append(Paragraph(instruction_text, instruction_style))
+        story.append(CachedParagraph(instruction_text, instruction_style))
         
         content_text = f"<b>Content:</b> {single_task_assignment}"
-        story.append(Paragraph(content_text, content_style))
+        story.append(CachedParagraph(content_text, content_style))
         
         story.append(Spacer(1, 0.1*inch))
     
@@ -223,10 +237,10 @@ def process_subform(json_filename, folder='1'):
             step_number += 1
             # Create instruction for Info Text field
             instruction_text = f"<b>STEP {step_number}: Create an Info Text field</b>"
-            story.append(Paragraph(instruction_text, instruction_style))
+            story.append(CachedParagraph(instruction_text, instruction_style))
             
             content_text = f"<b>Content:</b> {task_assignment}"
-            story.append(Paragraph(content_text, content_style))
+            story.append(CachedParagraph(content_text, content_style))
             
             story.append(Spacer(1, 0.1*inch))
         
@@ -243,7 +257,7 @@ def process_subform(json_filename, folder='1'):
         
         # Build instruction
         instruction_text = f"<b>STEP {step_number}: Create a {field_type} field</b>"
-        story.append(Paragraph(instruction_text, instruction_style))
+        story.append(CachedParagraph(instruction_text, instruction_style))
         
         # Add field properties
         properties = []
@@ -270,13 +284,15 @@ def process_subform(json_filename, folder='1'):
         
         # Add all properties
         for prop in properties:
-            story.append(Paragraph(prop, content_style))
+            story.append(CachedParagraph(prop, content_style))
         
         story.append(Spacer(1, 0.12*inch))  # Spacing between steps
     
     # Build PDF
     doc.build(story)
     print(f"Created: {pdf_path}")
+    
+    return pdf_path, data
 
 if __name__ == '__main__':
     main()
@@ -8,6 +8,7 @@ and contains all fields (rows) that share that naming convention.
 import csv
 import json
 import os
+import sys
 from collections import defaultdict
 
 # Configuration
@@ -15,6 +16,72 @@ CSV_FILE = 'checklist.csv'
 OUTPUT_DIR = 'subforms'
 TEST_MODE = False  # Set to False to generate all subforms
 
+# Shared option sets - every YesNo row points at the same tuple instead of a fresh list
+YES_NO_OPTIONS = ('Yes', 'No')
+_OPTION_SETS = {YES_NO_OPTIONS: YES_NO_OPTIONS}
+
+def intern_options(options):
+    """Return the shared tuple for an option set, registering it on first use"""
+    options = tuple(sys.intern(option) for option in options)
+    return _OPTION_SETS.setdefault(options, options)
+
+class Field:
+    """
+    Compact record for a single checklist row.
+    Uses __slots__ so a row costs one small object instead of a dict,
+    and interns the low-cardinality strings (frequency, assignment, type)
+    so repeated values share one copy.
+    """
+    __slots__ = ('inspection_task', 'frequency', 'jb_task_assignment', 'description', 'type', 'options')
+
+    def __init__(self, inspection_task, frequency, jb_task_assignment, description, type=None, options=None):
+        self.inspection_task = inspection_task
+        self.frequency = sys.intern(frequency)
+        self.jb_task_assignment = sys.intern(jb_task_assignment)
+        self.description = description
+        self.type = sys.intern(type) if type is not None else None
+        self.options = intern_options(options) if options is not None else None
+
+    def to_dict(self):
+        """Build the JSON object for this field (same keys and order as before)"""
+        field = {
+            'inspection_task': self.inspection_task,
+            'frequency': self.frequency,
+            'jb_task_assignment': self.jb_task_assignment,
+            'description': self.description
+        }
+        if self.type is not None:
+            field['type'] = self.type
+        if self.options is not None:
+            field['options'] = list(self.options)
+        return field
+
+def field_from_row(row):
+    """Create a Field from a CSV row"""
+    measurement_type = row.get('Measurement Type', '').strip()
+    response_type = row.get('Response Type', '').strip()
+    
+    # Clean up description - replace newlines with spaces
+    description = row.get('Description', '').strip()
+    description = ' '.join(description.split())  # Replace all whitespace (including \n) with single spaces
+    
+    # Add type field if measurement_type is YesNo
+    field_type = 'Single Select' if measurement_type == 'YesNo' else None
+    
+    # Add options if it's a Specific List with YesNo
+    options = None
+    if response_type == 'Specific List' and measurement_type == 'YesNo':
+        options = YES_NO_OPTIONS
+    
+    return Field(
+        inspection_task=row.get('Inspection Task', '').strip(),
+        frequency=row.get('Frequency', '').strip(),
+        jb_task_assignment=row.get('JB Task Assignment', '').strip(),
+        description=description,
+        type=field_type,
+        options=options
+    )
+
 def main():
     # Create output directory if it doesn't exist
     if not os.path.exists(OUTPUT_DIR):
@@ -37,28 +104,8 @@ def main():
             # Keep forms starting with '-' as separate forms (don't merge with numbered forms)
             # Forms starting with '-' will be placed in the '-' subfolder
             
-            # Create field object from row
-            measurement_type = row.get('Measurement Type', '').strip()
-            response_type = row.get('Response Type', '').strip()
-            
-            # Clean up description - replace newlines with spaces
-            description = row.get('Description', '').strip()
-            description = ' '.join(description.split())  # Replace all whitespace (including \n) with single spaces
-            
-            field = {
-                'inspection_task': row.get('Inspection Task', '').strip(),
-                'frequency': row.get('Frequency', '').strip(),
-                'jb_task_assignment': row.get('JB Task Assignment', '').strip(),
-                'description': description
-            }
-            
-            # Add type field if measurement_type is YesNo
-            if measurement_type == 'YesNo':
-                field['type'] = 'Single Select'
-            
-            # Add options array if it's a Specific List with YesNo
-            if response_type == 'Specific List' and measurement_type == 'YesNo':
-                field['options'] = ['Yes', 'No']
+            # Create field record from row
+            field = field_from_row(row)
             
             subforms[naming_convention].append(field)
     
@@ -107,7 +154,7 @@ def create_subform_json(naming_convention, fields):
     safe_filename = naming_convention.replace('/', '-').replace('\\', '-')
     
     # Sort fields by the number at the end of inspection_task
-    sorted_fields = sorted(fields, key=lambda f: extract_sort_key(f.get('inspection_task', '')))
+    sorted_fields = sorted(fields, key=lambda f: extract_sort_key(f.inspection_task))
     
     # All JSON files go in the main subforms directory
     filepath = os.path.join(OUTPUT_DIR, f"{safe_filename}.json")
@@ -116,7 +163,7 @@ def create_subform_json(naming_convention, fields):
     subform = {
         'name': naming_convention,
         'field_count': len(sorted_fields),
-        'fields': sorted_fields
+        'fields': [field.to_dict() for field in sorted_fields]
     }
     
     # Write JSON file
@@ -0,0 +1,72 @@
+#!/usr/bin/env python3
+"""
+Cross-subform layout cache for reportlab paragraphs.
+Most checklist descriptions repeat across many subforms, so instead of
+re-wrapping the same text for every PDF, CachedParagraph stores the line
+breaks and height from the first wrap of each (text, style, width) and
+reuses them for every later paragraph with the same key.
+"""
+
+import weakref
+
+from reportlab.platypus import Paragraph
+from reportlab.platypus.paragraph import _FUZZ
+
+# Attributes Paragraph.wrap() sets on the instance (breakLines swaps in processed frags)
+_LAYOUT_ATTRS = ('frags', 'blPara', '_wrapWidths', 'height', '_width_max', '_hyphenations')
+
+_cache = {}
+_style_keys = weakref.WeakKeyDictionary()
+_stats = {'hits': 0, 'misses': 0}
+
+def style_key(style):
+    """
+    Hashable key for a ParagraphStyle.
+    The generators create fresh style objects for every subform, so styles
+    are keyed by their attributes rather than by identity.
+    """
+    key = _style_keys.get(style)
+    if key is None:
+        key = tuple(sorted((name, repr(value)) for name, value in style.__dict__.items() if name != 'parent'))
+        _style_keys[style] = key
+    return key
+
+def _shareable(style):
+    """
+    False for styles whose layout is mutated after wrapping: hyphenation
+    (split changes frag classes) and RTL (draw reverses line words).
+    """
+    return not (style.hyphenationLang or style.uriWasteReduce
+                or style.embeddedHyphenation or style.wordWrap == 'RTL')
+
+class CachedParagraph(Paragraph):
+    """Paragraph whose wrap() result is shared with every paragraph of the same text, style and width"""
+
+    def wrap(self, availWidth, availHeight):
+        # Split halves, no-room wraps, and layouts that split or draw modifies in place get a private layout
+        if self.text is None or availWidth < _FUZZ or not _shareable(self.style):
+            return Paragraph.wrap(self, availWidth, availHeight)
+
+        key = (self.text, style_key(self.style), self.bulletText, availWidth)
+        layout = _cache.get(key)
+        if layout is None:
+            _stats['misses'] += 1
+            Paragraph.wrap(self, availWidth, availHeight)
+            _cache[key] = {attr: getattr(self, attr) for attr in _LAYOUT_ATTRS if hasattr(self, attr)}
+        else:
+            _stats['hits'] += 1
+            self.__dict__.update(layout)
+            self.width = availWidth
+        return self.width, self.height
+
+def cache_stats():
+    """Return (hits, misses, hit_rate) for the current run"""
+    hits = _stats['hits']
+    misses = _stats['misses']
+    total = hits + misses
+    return hits, misses, (hits / total if total else 0.0)
+
+def report():
+    """Print the layout cache hit rate"""
+    hits, misses, hit_rate = cache_stats()
+    print(f"\nLayout cache: {hits} hits, {misses} misses ({hit_rate:.1%} hit rate, {len(_cache)} layouts)")
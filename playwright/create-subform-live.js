@@ -546,6 +546,26 @@ function getCheckpointKey(folderNumber, fileName) {
   return `${folderNumber}:${fileName}`;
 }
 
+// Work queue written by the Python PDF generators (upload_queue.py)
+const UPLOAD_QUEUE_FILE = 'upload_queue.jsonl';
+
+function loadUploadQueue(pdfDir, folderNumber) {
+  const queuePath = join(pdfDir, UPLOAD_QUEUE_FILE);
+  if (!existsSync(queuePath)) {
+    return null;
+  }
+  try {
+    return readFileSync(queuePath, 'utf-8')
+      .split('\n')
+      .filter(line => line.trim())
+      .map(line => JSON.parse(line))
+      .filter(entry => entry.folder === folderNumber.toString());
+  } catch (error) {
+    console.log(`⚠️  Could not load upload queue: ${error.message}`);
+    return null;
+  }
+}
+
 async function batchProcessPDFs(pdfDir, folderNumber, limit = null, resume = false) {
   const folderPath = join(pdfDir, folderNumber.toString());
   console.log(`\n📁 Batch processing PDFs from folder: ${folderNumber}`);
@@ -566,15 +586,40 @@ async function batchProcessPDFs(pdfDir, folderNumber, limit = null, resume = fal
   }
   
   const folderCheckpoint = checkpoint[folderKey];
+  if (!folderCheckpoint.hashes) {
+    folderCheckpoint.hashes = {};
+  }
+  
+  // Content hash per file from the upload queue (if the generators wrote one)
+  const queue = loadUploadQueue(pdfDir, folderNumber);
+  const queueHashes = {};
   
   try {
-    const files = readdirSync(folderPath).filter(file => file.endsWith('.pdf'));
-    
-    console.log(`   Found ${files.length} PDF files in folder ${folderNumber}`);
+    let files;
+    if (queue) {
+      // Queue is already ordered by priority
+      files = queue.map(entry => entry.file);
+      queue.forEach(entry => {
+        queueHashes[entry.file] = entry.content_hash;
+        // Forms uploaded before hash tracking: adopt the current hash as the baseline
+        if (folderCheckpoint.completed.includes(entry.file) && !folderCheckpoint.hashes[entry.file]) {
+          folderCheckpoint.hashes[entry.file] = entry.content_hash;
+        }
+      });
+      console.log(`   Found ${files.length} PDF files in upload queue for folder ${folderNumber}`);
+    } else {
+      files = readdirSync(folderPath).filter(file => file.endsWith('.pdf'));
+      console.log(`   Found ${files.length} PDF files in folder ${folderNumber}`);
+    }
     
-    // Filter out already completed files if resuming
+    // Without resume, upload every file (in queue priority order when there is a queue)
     let filesToProcess = files;
-    if (resume && folderCheckpoint.completed.length > 0) {
+    if (resume && queue) {
+      // Only upload new or changed forms (hash differs from the last successful upload)
+      filesToProcess = files.filter(f => folderCheckpoint.hashes[f] !== queueHashes[f]);
+      console.log(`   📋 Upload queue: ${files.length - filesToProcess.length} unchanged, ${filesToProcess.length} new or changed`);
+    } else if (resume && folderCheckpoint.completed.length > 0) {
+      // Filter out already completed files if resuming
       const completedSet = new Set(folderCheckpoint.completed);
       filesToProcess = files.filter(f => !completedSet.has(f));
       console.log(`   📋 Resuming: ${folderCheckpoint.completed.length} already completed, ${filesToProcess.length} remaining`);
@@ -588,18 +633,21 @@ async function batchProcessPDFs(pdfDir, folderNumber, limit = null, resume = fal
     }
     
     const itemsToProcess = filesToProcess.length;
-    let successCount = folderCheckpoint.completed.length;
-    let failCount = folderCheckpoint.failed.length;
+    // Queue mode re-uploads forms already in completed, so count this run only
+    let successCount = queue ? 0 : folderCheckpoint.completed.length;
+    let failCount = queue ? 0 : folderCheckpoint.failed.length;
+    const progressTotal = queue ? itemsToProcess : files.length;
     
-    console.log(`\n   Starting from item ${successCount + failCount + 1} of ${files.length} total\n`);
+    console.log(`\n   Starting from item ${successCount + failCount + 1} of ${progressTotal} total\n`);
     
     for (let i = 0; i < itemsToProcess; i++) {
       const fileName = filesToProcess[i];
       const formName = fileName.replace('.pdf', ''); // Remove .pdf extension
       const pdfPath = join(folderPath, fileName);
       const checkpointKey = getCheckpointKey(folderNumber, fileName);
+      const itemNumber = queue ? i + 1 : successCount + failCount + i + 1;
       
-      console.log(`\n[${successCount + failCount + i + 1}/${files.length}] Processing: ${formName}`);
+      console.log(`\n[${itemNumber}/${progressTotal}] Processing: ${formName}`);
       
       let success = false;
       let errorMessage = null;
@@ -610,8 +658,13 @@ async function batchProcessPDFs(pdfDir, folderNumber, limit = null, resume = fal
         });
         
         if (success) {
-          console.log(`✅ PDF ${successCount + failCount + i + 1} completed`);
-          folderCheckpoint.completed.push(fileName);
+          console.log(`✅ PDF ${itemNumber} completed`);
+          if (!folderCheckpoint.completed.includes(fileName)) {
+            folderCheckpoint.completed.push(fileName);
+          }
+          if (queueHashes[fileName]) {
+            folderCheckpoint.hashes[fileName] = queueHashes[fileName];
+          }
           // Remove from failed list if it was there before
           const failedIndex = folderCheckpoint.failed.indexOf(fileName);
           if (failedIndex > -1) {
@@ -620,7 +673,7 @@ async function batchProcessPDFs(pdfDir, folderNumber, limit = null, resume = fal
           delete folderCheckpoint.errors[checkpointKey];
           successCount++;
         } else {
-          console.log(`❌ PDF ${successCount + failCount + i + 1} failed`);
+          console.log(`❌ PDF ${itemNumber} failed`);
           if (!folderCheckpoint.failed.includes(fileName)) {
             folderCheckpoint.failed.push(fileName);
           }
@@ -629,7 +682,7 @@ async function batchProcessPDFs(pdfDir, folderNumber, limit = null, resume = fal
         }
       } catch (error) {
         // Continue processing even if individual item fails
-        console.log(`❌ PDF ${successCount + failCount + i + 1} errored: ${error.message}`);
+        console.log(`❌ PDF ${itemNumber} errored: ${error.message}`);
         if (!folderCheckpoint.failed.includes(fileName)) {
           folderCheckpoint.failed.push(fileName);
         }
@@ -0,0 +1,130 @@
+#!/usr/bin/env python3
+"""
+Upload work-queue export for the Playwright batch uploader.
+The PDF generators call write_upload_queue() after a full run to write
+upload_queue.jsonl into their output directory: one JSON object per subform,
+ordered so that changed and large forms come first and unchanged forms are
+marked skip. Change tracking compares each subform's content hash with the
+hash the uploader recorded in playwright/upload_checkpoint.json when it last
+uploaded that PDF.
+"""
+
+import hashlib
+import json
+import os
+
+# Configuration
+QUEUE_FILENAME = 'upload_queue.jsonl'
+CHECKPOINT_FILE = os.path.join('playwright', 'upload_checkpoint.json')
+
+# Changed forms go before new ones, unchanged forms go last
+STATUS_ORDER = {'changed': 0, 'new': 1, 'unchanged': 2}
+
+def content_hash(data):
+    """
+    Hash the subform JSON the PDF is built from.
+    The PDF bytes themselves embed a creation timestamp, so they differ on
+    every build even when nothing changed.
+    """
+    canonical = json.dumps(data, sort_keys=True, ensure_ascii=False, separators=(',', ':'))
+    return hashlib.sha256(canonical.encode('utf-8')).hexdigest()
+
+def estimate_field_count(data):
+    """
+    Estimate how many fields the uploader will create for a subform:
+    one per checklist field plus the Info Text fields for task assignments.
+    """
+    fields = data['fields']
+    assignments = [field.get('jb_task_assignment', '').strip() for field in fields]
+    unique_assignments = set([a for a in assignments if a])
+
+    if len(unique_assignments) <= 1:
+        return len(fields) + len(unique_assignments)
+
+    # One Info Text field each time the assignment changes
+    info_fields = 0
+    previous = None
+    for assignment in assignments:
+        if assignment and assignment != previous:
+            info_fields += 1
+        previous = assignment
+    return len(fields) + info_fields
+
+def load_uploaded(checkpoint_file=CHECKPOINT_FILE):
+    """
+    Read the uploader checkpoint.
+    Returns {(folder, pdf_filename): content_hash or None} for every completed
+    upload. None means the PDF was uploaded before hashes were recorded.
+    """
+    if not os.path.exists(checkpoint_file):
+        return {}
+
+    try:
+        with open(checkpoint_file, 'r', encoding='utf-8') as f:
+            checkpoint = json.load(f)
+    except (OSError, ValueError) as e:
+        print(f"Warning: could not read checkpoint {checkpoint_file}: {e}")
+        return {}
+
+    uploaded = {}
+    for folder_key, folder_checkpoint in checkpoint.items():
+        if not folder_key.startswith('folder_'):
+            continue
+        folder = folder_key[len('folder_'):]
+        hashes = folder_checkpoint.get('hashes', {})
+        for pdf_filename in folder_checkpoint.get('completed', []):
+            uploaded[(folder, pdf_filename)] = hashes.get(pdf_filename)
+    return uploaded
+
+def build_entry(folder, pdf_path, data, uploaded):
+    """Create the queue entry for one generated PDF"""
+    pdf_filename = os.path.basename(pdf_path)
+    digest = content_hash(data)
+
+    key = (folder, pdf_filename)
+    if key not in uploaded:
+        status = 'new'
+    elif uploaded[key] is None or uploaded[key] == digest:
+        # Uploads from before hash tracking are treated as current
+        status = 'unchanged'
+    else:
+        status = 'changed'
+
+    return {
+        'name': data['name'],
+        'folder': folder,
+        'file': pdf_filename,
+        'status': status,
+        'skip': status == 'unchanged',
+        'content_hash': digest,
+        'size': os.path.getsize(pdf_path),
+        'estimated_field_count': estimate_field_count(data)
+    }
+
+def write_upload_queue(output_dir, entries):
+    """
+    Order the entries and write them to output_dir/upload_queue.jsonl.
+    Pending forms come first (changed, then new), largest first within each
+    group; unchanged forms follow, marked skip. Returns the queue path.
+    """
+    ordered = sorted(entries, key=lambda e: (
+        STATUS_ORDER[e['status']],
+        -e['estimated_field_count'],
+        -e['size'],
+        e['folder'],
+        e['file']
+    ))
+
+    queue_path = os.path.join(output_dir, QUEUE_FILENAME)
+    with open(queue_path, 'w', encoding='utf-8') as f:
+        for priority, entry in enumerate(ordered, 1):
+            entry = dict(entry, priority=priority)
+            f.write(json.dumps(entry, ensure_ascii=False) + '\n')
+
+    counts = {status: 0 for status in STATUS_ORDER}
+    for entry in ordered:
+        counts[entry['status']] += 1
+    print(f"\nUpload queue: {queue_path}")
+    print(f"  {counts['changed']} changed, {counts['new']} new, {counts['unchanged']} unchanged (skip)")
+
+    return queue_path